@@ -118,7 +118,9 @@ class FramePlayer():
 
         # Do nothing if the player is stopped or paused
         if self.playing_state == FramePlayer.PlayerState.PLAYING:
-            current_time = time.time()
+            # The monotonic clock can't jump backwards (or forwards) when NTP steps the system time, which would
+            # otherwise stall or burst the frame cadence
+            current_time = time.monotonic()
             elapsed_time = current_time - self.last_update_time
             if elapsed_time >= self.frame_interval:
                 # NOTE: This assumes that each frame takes about the same amount of time to update and send.
@@ -131,7 +133,7 @@ class FramePlayer():
                 updated_frame, self.frame_interval = self.framer.update()
                 if updated_frame is not None:
                     self.led_matrix.send_matrix(updated_frame)
-                    return time.time() - self.last_update_time
+                    return time.monotonic() - self.last_update_time
                 elif updated_frame == None or self.frame_interval == 0:
                     # A None value means the animation is done
                     self.stop()
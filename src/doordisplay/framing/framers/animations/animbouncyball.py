@@ -2,6 +2,39 @@ from framing.framers.framer import Framer
 import numpy as np
 from framing.utils import place_in
 
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError: # pragma: no cover - numba is pinned in requirements, but keep it a soft dependency
+    _NUMBA_AVAILABLE = False
+
+if _NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _step_balls(x, y, vx, vy, sizes, width, height, dt):
+        """
+        Numba kernel for the per-frame ball physics: integrate, clamp to the frame, and bounce off the walls. Runs the
+        whole step as one compiled loop so update() pays a single call instead of several NumPy dispatches.
+        """
+        for i in range(x.shape[0]):
+            x[i] += vx[i] * dt
+            y[i] += vy[i] * dt
+
+            max_x = width - sizes[i]
+            max_y = height - sizes[i]
+            if x[i] < 0.0:
+                x[i] = 0.0
+            elif x[i] > max_x:
+                x[i] = max_x
+            if y[i] < 0.0:
+                y[i] = 0.0
+            elif y[i] > max_y:
+                y[i] = max_y
+
+            if x[i] >= max_x or x[i] <= 0.0:
+                vx[i] = -vx[i]
+            if y[i] >= max_y or y[i] <= 0.0:
+                vy[i] = -vy[i]
+
 class BouncyBall():
 
     def __init__(self,
@@ -23,21 +56,25 @@ class BouncyBall():
         center = self.size//2
         radius = self.size/2
 
-        # Create a meshgrid of x and y values
-        x, y = np.meshgrid(np.arange(size), np.arange(size))
+        # Broadcast open grids instead of materializing two full size x size meshgrid arrays
+        y, x = np.ogrid[:size, :size]
 
         # Use the circle equation to set values inside the circle to self.color
         circle_mask = (x - center)**2 + (y - center)**2 <= radius**2
         self.matrix[circle_mask, :] = self.color
+        # Keep the mask around so blits can scatter just the circle pixels instead of threshold-scanning the sprite
+        self.mask = circle_mask
 
 
 class AnimBouncyBall(Framer):
-    def __init__(self, num_balls: int = 8, trail_factor: float = 0.75, interpolate: bool = True):
+    def __init__(self, num_balls: int = 8, trail_factor: float = 0.75, interpolate: bool = True,
+                 collide: bool = False):
         super().__init__()
         # Create the matrix for the frame
         self.matrix = np.zeros((self.HEIGHT, self.WIDTH, 3), dtype=np.uint8)
         self.trail_factor = trail_factor
         self.interpolate = interpolate
+        self.collide = collide
 
         self.balls: list[BouncyBall] = []
         for _ in range(num_balls):
@@ -50,33 +87,92 @@ class AnimBouncyBall(Framer):
                 color=np.random.randint(0, 255, 3)
             ))
 
-
+        # SoA copies of the ball state so the physics runs as a handful of vectorized NumPy ops instead of per-ball
+        # Python arithmetic. The BouncyBall objects just hold the sprites; these arrays are the authoritative state.
+        self._ball_x     = np.array([ball.x for ball in self.balls], dtype=np.float64)
+        self._ball_y     = np.array([ball.y for ball in self.balls], dtype=np.float64)
+        self._ball_vx    = np.array([ball.speed_x for ball in self.balls], dtype=np.float64)
+        self._ball_vy    = np.array([ball.speed_y for ball in self.balls], dtype=np.float64)
+        self._ball_sizes = np.array([ball.size for ball in self.balls], dtype=np.float64)
 
     def update(self):
-        # Apply the trail factor to the frame
-        self.matrix = (self.matrix * self.trail_factor).astype(np.uint8)
-
-
-        for ball in self.balls:
-            # Move the ball
-            ball.x += ball.speed_x * self.dt
-            ball.y += ball.speed_y * self.dt
-
-            # Limit the ball's position to the frame
-            ball.x = max(min(ball.x, self.WIDTH - ball.size), 0)
-            ball.y = max(min(ball.y, self.HEIGHT - ball.size), 0)
-            
-            # If the ball hits the edge of the frame, reverse its direction
-            if ball.x >= self.WIDTH - ball.size or ball.x <= 0:
-                ball.speed_x *= -1
-            if ball.y >= self.HEIGHT - ball.size or ball.y <= 0:
-                ball.speed_y *= -1
-
-            ball_x = ball.x if self.interpolate else round(ball.x)
-            ball_y = ball.y if self.interpolate else round(ball.y)
-            # Place the ball in the frame
-            place_in(self.matrix, ball.matrix, ball_y, ball_x, transparent_threshold=10)
+        # Apply the trail factor to the frame. The fixed-point multiply writes back into the existing uint8 buffer
+        # instead of allocating a float frame plus a uint8 copy every tick.
+        self.matrix[:] = (self.matrix.astype(np.uint16) * self._trail_scaler) >> 8
+
+        if _NUMBA_AVAILABLE:
+            # Move, clamp, and bounce all the balls in one compiled call
+            _step_balls(self._ball_x, self._ball_y, self._ball_vx, self._ball_vy, self._ball_sizes,
+                        float(self.WIDTH), float(self.HEIGHT), self.dt)
+        else:
+            # Move the balls
+            self._ball_x += self._ball_vx * self.dt
+            self._ball_y += self._ball_vy * self.dt
+
+            # Limit the balls' positions to the frame
+            max_x = self.WIDTH - self._ball_sizes
+            max_y = self.HEIGHT - self._ball_sizes
+            np.clip(self._ball_x, 0, max_x, out=self._ball_x)
+            np.clip(self._ball_y, 0, max_y, out=self._ball_y)
+
+            # If a ball hits the edge of the frame, reverse its direction. The masked in-place negate is a single
+            # branchless ufunc call per axis, with no fancy-index gather/scatter.
+            np.negative(self._ball_vx, where=(self._ball_x >= max_x) | (self._ball_x <= 0), out=self._ball_vx)
+            np.negative(self._ball_vy, where=(self._ball_y >= max_y) | (self._ball_y <= 0), out=self._ball_vy)
+
+        if self.collide:
+            self._collide_balls()
+
+        ball_xs = self._ball_x if self.interpolate else np.round(self._ball_x)
+        ball_ys = self._ball_y if self.interpolate else np.round(self._ball_y)
+        # Place the balls in the frame
+        for ball, ball_x, ball_y in zip(self.balls, ball_xs, ball_ys):
+            place_in(self.matrix, ball.matrix, ball_y, ball_x, transparent_threshold=10, mask=ball.mask)
         return super().update()
 
+    def _collide_balls(self):
+        """
+        Bounces balls off each other by swapping the velocities of every overlapping pair. The whole check is one
+        broadcasted squared-distance comparison against the squared sum of radii, so there is no per-pair Python loop
+        and no sqrt.
+        """
+        center_x = self._ball_x + self._ball_sizes * 0.5
+        center_y = self._ball_y + self._ball_sizes * 0.5
+        dx = center_x[:, np.newaxis] - center_x[np.newaxis, :]
+        dy = center_y[:, np.newaxis] - center_y[np.newaxis, :]
+        radii_sum_sq = ((self._ball_sizes[:, np.newaxis] + self._ball_sizes[np.newaxis, :]) * 0.5)**2
+
+        # Upper triangle only so each pair is handled once (and a ball never collides with itself)
+        colliding = np.triu(dx*dx + dy*dy <= radii_sum_sq, k=1)
+        first_idx, second_idx = np.where(colliding)
+        if first_idx.size:
+            # NOTE: Fancy indexing returns copies, so both right-hand sides are snapshots and the swap is safe
+            self._ball_vx[first_idx], self._ball_vx[second_idx] = \
+                self._ball_vx[second_idx], self._ball_vx[first_idx]
+            self._ball_vy[first_idx], self._ball_vy[second_idx] = \
+                self._ball_vy[second_idx], self._ball_vy[first_idx]
+
     def reset(self):
-        pass
\ No newline at end of file
+        pass
+
+    @property
+    def trail_factor(self) -> float:
+        """
+        Gets the trail factor used to fade out the ball trails.
+
+        Returns:
+            float: The trail factor.
+        """
+        return self._trail_factor
+
+    @trail_factor.setter
+    def trail_factor(self, factor: float):
+        """
+        Sets the trail factor used to fade out the ball trails.
+
+        Args:
+            factor (float): The trail factor. 0 clears the trails every frame, 1 never fades them.
+        """
+        self._trail_factor = factor
+        # Fixed-point (8 fractional bit) scaler for the in-place integer decay multiply in update()
+        self._trail_scaler = int(round(factor * 256))
\ No newline at end of file
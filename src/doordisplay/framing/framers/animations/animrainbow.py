@@ -1,6 +1,5 @@
 from framing.framers.framer import Framer
 import numpy as np
-from colorsys import hsv_to_rgb
 
 class AnimRainbow(Framer):
     """
@@ -26,24 +25,78 @@ class AnimRainbow(Framer):
         self.phase_deg = 0.0
         self.saturation = 1.0
 
+        # Circulant index map used by update() to build the full frame with a single gather. Row r of the frame is the
+        # rainbow array rolled forward by r, i.e. matrix[r, c] = rgb_array[(c - r) % WIDTH].
+        self._col_idx = (np.arange(self.WIDTH)[np.newaxis, :] - np.arange(self.HEIGHT)[:, np.newaxis]) % self.WIDTH
+        # Reused frame buffer so update() doesn't allocate a fresh HEIGHT x WIDTH x 3 array every frame
+        self.matrix = np.zeros((self.HEIGHT, self.WIDTH, 3), dtype=np.uint8)
+
     def get_rgb_array(self):
         """
-        Generates an array of RGB values representing the rainbow animation.
+        Generates an array of RGB values representing the rainbow animation. Only the phase changes frame to frame, so
+        the colors come from a 360-entry hue lookup table (rebuilt when saturation changes) and each frame is just a
+        WIDTH-long gather into it. Hues are quantized to whole degrees, well below what the panel can show.
 
         Returns:
             numpy.ndarray: The array of RGB values.
         """
+        if self._hue_lut is None:
+            self._hue_lut = self._build_hue_lut()
+
         hue_range = self.frequency * 360
         start_hue = self.phase_deg
         end_hue = start_hue + hue_range
 
-        rgb_array = np.zeros((self.WIDTH, 3), dtype=np.uint8)
-        for i, hue in enumerate(np.linspace(start_hue, end_hue, self.WIDTH)):
-            hue_normalized = (hue % 360) / 360
-            rgb = hsv_to_rgb(hue_normalized, self.saturation, 1.0)
-            rgb_array[i] = np.array(rgb) * 255
+        hue_indices = (np.linspace(start_hue, end_hue, self.WIDTH) % 360).astype(np.intp)
+        return self._hue_lut[hue_indices]
 
-        return rgb_array
+    def _build_hue_lut(self) -> np.ndarray:
+        """
+        Builds the 360-entry hue to RGB lookup table for the current saturation. The HSV to RGB conversion is
+        vectorized (value fixed at 1.0) so the whole table is computed with a handful of NumPy ops.
+
+        Returns:
+            numpy.ndarray: A (360, 3) uint8 lookup table of RGB values, one per degree of hue.
+        """
+        # Hue in units of 60 degree sectors, range [0, 6)
+        hue = np.arange(360) / 60
+        sector = hue.astype(np.intp)
+        sector_frac = hue - sector
+
+        # Standard HSV->RGB intermediates with value = 1.0
+        saturation = self.saturation
+        p = np.full(hue.shape, 1.0 - saturation)
+        q = 1.0 - saturation * sector_frac
+        t = 1.0 - saturation * (1.0 - sector_frac)
+        v = np.ones(hue.shape)
+
+        sector_masks = [sector == i for i in range(5)] # Sector 5 is the np.select default
+        red   = np.select(sector_masks, [v, q, p, p, t], default=v)
+        green = np.select(sector_masks, [t, v, v, q, p], default=p)
+        blue  = np.select(sector_masks, [p, p, t, v, v], default=q)
+
+        return (np.stack((red, green, blue), axis=1) * 255).astype(np.uint8)
+
+    @property
+    def saturation(self) -> float:
+        """
+        Gets the saturation of the rainbow colors.
+
+        Returns:
+            float: The saturation.
+        """
+        return self._saturation
+
+    @saturation.setter
+    def saturation(self, value: float):
+        """
+        Sets the saturation of the rainbow colors and invalidates the hue lookup table.
+
+        Args:
+            value (float): The saturation.
+        """
+        self._saturation = value
+        self._hue_lut = None
 
     def update(self):
         """
@@ -53,11 +106,9 @@ class AnimRainbow(Framer):
             numpy.ndarray: The updated matrix of RGB values.
         """
         rgb_array = self.get_rgb_array()
-        # matrix = np.tile(rgb_array, (self.HEIGHT, 1, 1))
-        self.matrix = np.zeros((self.HEIGHT, self.WIDTH, 3), dtype=np.uint8)
-        for row in range(self.HEIGHT):
-            self.matrix[row] = np.roll(rgb_array, row, axis=0)
-        
+        # One gather into the reused frame buffer instead of HEIGHT np.roll allocations/copies
+        np.take(rgb_array, self._col_idx, axis=0, out=self.matrix)
+
         self.phase_deg += self.speed
 
         return super().update()
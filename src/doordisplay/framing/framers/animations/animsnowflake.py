@@ -367,6 +367,7 @@ class AnimSnowflake(Framer):
                  snowflake_brightness_scalers: list[float, float, float] = [0.7, 0.8, 1.0],
                  snowflake_color: str | Callable[[int], Sequence[int]] = 'random',
                  speed_randomness: float = 0.2,
+                 profile: bool = False,
                 ) -> None:
         """
         Initializes a new instance of the AnimSnowflake class.
@@ -397,6 +398,7 @@ class AnimSnowflake(Framer):
                 'random', 'white', or a callable function that takes the size of the snowflake as input and returns a 
                 sequence of RGB values. Defaults to 'random'.
             speed_randomness (float, optional): The randomness factor for the snowflake speed. Defaults to 0.2.
+            profile (bool, optional): Whether to collect and print per-frame timing statistics. Defaults to False.
         """
         super().__init__()
         self.matrix = np.zeros((self.HEIGHT, self.WIDTH, 3), dtype=np.uint8)
@@ -433,7 +435,9 @@ class AnimSnowflake(Framer):
 
         opensimplex.seed(wind_seed or random.randint(0, 2**64-1))
 
-         # TODO: Remove after debugging
+        # Timing statistics, only collected and printed when profiling is enabled. The prints and time() calls used to
+        # run unconditionally, which cost real time (stdout flushes) on the frame hot path.
+        self._profile = profile
         self.max_draw_time = [0, 0, 0]
         self.avg_draw_time = 0
         self.max_accumulate_time = 0
@@ -447,15 +451,15 @@ class AnimSnowflake(Framer):
         Returns:
             np.ndarray: The updated snowflake matrix.
         """
-        self.matrix = (self.matrix * self.trail_factor).astype(np.uint8)
+        self._decay_impl()
 
-        start_time = time.time()
+        if self._profile:
+            start_time = time.time()
         for pos in self._get_new_snowflake_positions():
             self.add_snowflake(pos[0], pos[1])
-        end_time = time.time()
-        add_time = end_time - start_time
+        if self._profile:
+            add_time = time.time() - start_time
 
-        start_time = time.time()
         if self.storm_factor:
             simplex_storm_intensity = opensimplex.noise2(self.storm_pos, self._simplex_storm_idx) + 1
             self.storm_intensity = self.storm_factor * simplex_storm_intensity
@@ -466,10 +470,10 @@ class AnimSnowflake(Framer):
         simplex_wind_speed = opensimplex.noise2(self.wind_pos, self._simplex_wind_speed_idx)
         self.wind_speed = self.storm_intensity * self.wind_intensity * simplex_wind_speed
         self.wind_pos += self.wind_step
-        noise_time = time.time() - start_time
-        
+
         accumulate_total_time = 0
-        start_time = time.time()
+        if self._profile:
+            start_time = time.time()
         # Remove snowflakes that have fallen off the bottom of the matrix
         snowflakes_trimmed = []
         for snowflake in self.snowflakes:
@@ -482,16 +486,18 @@ class AnimSnowflake(Framer):
                 # NOTE: Since snowflakes are sorted by size, the larger ones should be drawn on top of the smaller ones
                 place_in(self.matrix, snowflake.matrix, y, x, transparent_threshold=5)
             elif snowflake.y >= self.HEIGHT - self.accumulator.layers:
-                accumulate_start_time = time.time()
+                if self._profile:
+                    accumulate_start_time = time.time()
                 # Accumulate snowflakes that have fallen off the bottom of the matrix
                 self.accumulator.accumulate(snowflake)
-                accumulate_total_time += time.time() - accumulate_start_time
+                if self._profile:
+                    accumulate_total_time += time.time() - accumulate_start_time
 
         self.snowflakes = snowflakes_trimmed
         self.matrix[-self.accumulator.layers:] = self.accumulator.accumulation
-        end_time = time.time()
 
-        if self.snowflakes:
+        if self._profile and self.snowflakes:
+            end_time = time.time()
             time_per_snowflake = (end_time - start_time) / len(self.snowflakes) * 1000
             time_all_snowflakes = (end_time - start_time) * 1000
             # Track the top 3 max draw times
@@ -502,7 +508,6 @@ class AnimSnowflake(Framer):
             self.avg_accumulate_time = self.avg_accumulate_time * alpha + accumulate_total_time * (1-alpha)
             self.avg_draw_time = self.avg_draw_time * alpha + time_all_snowflakes * (1-alpha)
             print(f"Add time: {add_time:.3f} ms")
-            # print(f"Noise time: {noise_time:.3f} ms")
             print(f"Accumulate time: {self.avg_accumulate_time*1e3:.3f} ms")
             print(f"Max accumulate time: {self.max_accumulate_time*1e3:.3f} ms")
             print(f"Draw time: {time_per_snowflake:.3f} ms")
@@ -512,9 +517,29 @@ class AnimSnowflake(Framer):
             print(len(self.snowflakes))
             # print(f"Wind speed: {self.wind_speed:.2f}")
             # print(f"Storm intensity: {self.storm_intensity:.2f}")
-        
+
         return super().update()
     
+    def _decay_clear(self) -> None:
+        """
+        Trail decay for trail_factor == 0. Clearing the matrix with fill() is an optimized memset and avoids the full
+        buffer multiply that the general decay path performs.
+        """
+        self.matrix.fill(0)
+
+    def _decay_none(self) -> None:
+        """
+        Trail decay for trail_factor == 1. The matrix is left untouched so the snowflakes never fade.
+        """
+        pass
+
+    def _decay_scale(self) -> None:
+        """
+        General trail decay. Scales the matrix by trail_factor using a fixed-point integer multiply so no intermediate
+        float matrix is allocated.
+        """
+        self.matrix[:] = (self.matrix.astype(np.uint16) * self._trail_scaler) >> 8
+
     def in_frame(self, snowflake: Snowflake) -> bool:
         """
         Checks if the snowflake is in bounds of the frame such that any part of it will be displayed.
@@ -559,18 +584,18 @@ class AnimSnowflake(Framer):
         elif x == self.WIDTH - 1:
             x += 1
 
+        # NOTE: Scaling by brightness_scaler makes smaller snowflakes slightly dimmer than larger snowflakes
         if isinstance(self.snowflake_color, Callable):
-            flake_color = np.array(self.snowflake_color(size))
+            flake_color = np.round(np.array(self.snowflake_color(size)) * brightness_scaler)
         elif self.snowflake_color == 'random':
             max_rand = 127
             flake_color = np.random.randint(0, max_rand, 3) + random.randint(0, 255-max_rand)
+            flake_color = np.round(flake_color * brightness_scaler)
         elif self.snowflake_color == 'white':
-            flake_color = np.array((255, 255, 255))
+            # White colors are constant per depth, so use the colors precomputed by the snowflake_color setter
+            flake_color = self._white_colors[depth_idx]
         else:
             raise ValueError(f"Invalid snowflake color: {self.snowflake_color}")
-        
-        # Make smaller snowflakes slightly smaller than larger snowflakes
-        flake_color = np.round(flake_color * brightness_scaler)
 
         bisect.insort(self.snowflakes, 
                       Snowflake(size, x, y, speed_scaler_x, speed_y, color=flake_color), 
@@ -660,6 +685,59 @@ class AnimSnowflake(Framer):
         snowflakes_per_update = self._snowflakes_gen_rate/60 * self.dt
         self._snowflake_chance = snowflakes_per_update / self.WIDTH
 
+    @property
+    def snowflake_color(self) -> str | Callable[[int], Sequence[int]]:
+        """
+        Gets the snowflake color setting. See __init__ for the valid values.
+
+        Returns:
+            str | Callable[[int], Sequence[int]]: The snowflake color setting.
+        """
+        return self._snowflake_color
+
+    @snowflake_color.setter
+    def snowflake_color(self, color: str | Callable[[int], Sequence[int]]):
+        """
+        Sets the snowflake color setting. For the constant 'white' setting, the brightness-scaled color for each depth
+        is precomputed here so add_snowflake doesn't have to allocate a new color array per spawn.
+
+        Args:
+            color (str | Callable[[int], Sequence[int]]): The snowflake color setting.
+        """
+        self._snowflake_color = color
+        if color == 'white':
+            self._white_colors = [np.array([round(255 * scaler)] * 3, dtype=np.uint8)
+                                  for scaler in self.snowflake_brightness_scalers]
+
+    @property
+    def trail_factor(self) -> float:
+        """
+        Gets the trail factor used to fade out the snowflakes.
+
+        Returns:
+            float: The trail factor.
+        """
+        return self._trail_factor
+
+    @trail_factor.setter
+    def trail_factor(self, factor: float):
+        """
+        Sets the trail factor used to fade out the snowflakes. The decay implementation is bound here once so update()
+        doesn't have to branch on the factor every frame.
+
+        Args:
+            factor (float): The trail factor. 0 clears the matrix every frame, 1 never fades the snowflakes.
+        """
+        self._trail_factor = factor
+        if factor == 0.0:
+            self._decay_impl = self._decay_clear
+        elif factor == 1.0:
+            self._decay_impl = self._decay_none
+        else:
+            # Fixed-point (8 fractional bit) scaler for the integer decay multiply
+            self._trail_scaler = int(round(factor * 256))
+            self._decay_impl = self._decay_scale
+
     @property
     def fall_speed(self) -> float:
         """
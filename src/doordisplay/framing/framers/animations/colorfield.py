@@ -1,10 +1,77 @@
 from framing.framers.framer import Framer
 from typing import Sequence, Callable
 from dataclasses import dataclass
+import math
 import numpy as np
-import opensimplex # NOTE: Installing numba will increase performance of noise generation
+import opensimplex # NOTE: opensimplex swaps in a numba-JIT'd backend when numba is importable (it's in requirements)
+# NOTE: An in-tree @njit simplex kernel was considered to cut opensimplex's wrapper overhead, but the wrapper is paid
+# once per frame (the noise*array batch calls) and the inner loops are already numba-compiled by opensimplex itself.
+# Forking the kernel into this repo would add maintenance and seed-compatibility risk for sub-microsecond savings.
 from time import time
 
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError: # pragma: no cover - numba is pinned in requirements, but keep it a soft dependency
+    _NUMBA_AVAILABLE = False
+
+if _NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _sin_remap(values):
+        """
+        Fused numba kernel for the sin value map: one pass over the field with a single load and store per pixel
+        instead of the four separate NumPy passes (scale, sin, scale, shift).
+        """
+        out = np.empty_like(values)
+        for i in prange(values.shape[0]):
+            for j in range(values.shape[1]):
+                out[i, j] = math.sin((values[i, j] * 2.0 - 1.0) * math.pi) * 0.5 + 0.5
+        return out
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _sigmoid_remap(values, a):
+        """Fused numba kernel for the sigmoid value map (see _sin_remap for why)."""
+        out = np.empty_like(values)
+        for i in prange(values.shape[0]):
+            for j in range(values.shape[1]):
+                out[i, j] = 1.0 / (1.0 + math.exp(-a * (values[i, j] * 2.0 - 1.0)))
+        return out
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _tan_remap(values, a, scaler):
+        """Fused numba kernel for the tan value map (see _sin_remap for why)."""
+        out = np.empty_like(values)
+        for i in prange(values.shape[0]):
+            for j in range(values.shape[1]):
+                out[i, j] = math.tan(a * (values[i, j] * 2.0 - 1.0)) * scaler * 0.5 + 0.5
+        return out
+
+_opensimplex_warmed_up = False
+
+# Base coordinate ramps shared by every framer at the same resolution. arange is computed once per process per length;
+# reset() multiplies by the per-instance zoom scaler, which also gives each instance its own mutable copy (the spatial
+# advance mutates positions in place).
+_COORD_BASE: dict[int, np.ndarray] = {}
+
+def _coord_base(length: int) -> np.ndarray:
+    base = _COORD_BASE.get(length)
+    if base is None:
+        base = np.arange(length, dtype=np.float32)
+        base.setflags(write=False)
+        _COORD_BASE[length] = base
+    return base
+
+def _warm_up_opensimplex() -> None:
+    """
+    Runs a tiny throwaway noise call so opensimplex's numba backend pays its JIT compile cost here instead of on the
+    first rendered frame.
+    """
+    global _opensimplex_warmed_up
+    if not _opensimplex_warmed_up:
+        opensimplex.noise2array(np.zeros(1), np.zeros(1))
+        opensimplex.noise3array(np.zeros(1), np.zeros(1), np.zeros(1))
+        _opensimplex_warmed_up = True
+
 # ------------------------------------------
 # Field maps
 # ------------------------------------------
@@ -13,8 +80,15 @@ Field maps are functions that take x, y, and t as input and return a 2D array of
 generate the color field. The field maps can be used to generate different types of fields, such as simplex noise or
 sinusoidal fields.
 """
+# Drift direction used by simplex_field to fold time into the 2D noise coordinates. The irrational ratio keeps the
+# drift from lining up with the noise lattice and producing visible repetition.
+_SIMPLEX_DRIFT_X = 0.7548776662466927
+_SIMPLEX_DRIFT_Y = 0.5698402909980532
+
 def simplex_field(x:np.ndarray, y:np.ndarray, t:float) -> np.ndarray:
-    """Generates a field of simplex noise values.
+    """Generates a field of simplex noise values. Time is rolled into a slow drift of the 2D sample coordinates rather
+    than a third noise axis, so the kernel only evaluates 2D noise (cheaper inner loop, and no degenerate (1, H, W)
+    slab to squeeze away).
 
     Args:
         x (np.ndarray): x-coordinates of the field.
@@ -24,10 +98,17 @@ def simplex_field(x:np.ndarray, y:np.ndarray, t:float) -> np.ndarray:
     Returns:
         np.ndarray: 2D array of simplex noise values.
     """
-    noise = opensimplex.noise3array(np.array([t]), x, y)
+    # opensimplex only accepts float64 input, so convert at the call boundary and drop back to float32 after.
+    # Single precision is plenty for an 8-bit panel and halves the memory traffic of everything downstream.
+    noise = opensimplex.noise2array(x.astype(np.float64) + t * _SIMPLEX_DRIFT_X,
+                                    y.astype(np.float64) + t * _SIMPLEX_DRIFT_Y)
     # simplex noise has the range [-1, 1], normalize to [0, 1]:
     noise = (noise + 1) * 0.5
-    return noise.squeeze() # Return value should be a len(y) x len(x) array, so squeeze the extra dimension
+    return noise.astype(np.float32, copy=False)
+
+# Cache of sin_field's grid-dependent trig. Only t changes frame to frame when the field isn't drifting spatially, so
+# sin(x) and cos(y) are reused until the coordinate arrays actually change (detected via their endpoints and lengths).
+_sin_field_cache = {'key': None, 'sin_x': None, 'cos_y': None}
 
 def sin_field(x:np.ndarray, y:np.ndarray, t:float) -> np.ndarray:
     """Generates a field of sinusoidal inspired values. The field (scaling omitted) is created as:
@@ -42,17 +123,23 @@ def sin_field(x:np.ndarray, y:np.ndarray, t:float) -> np.ndarray:
     Returns:
         np.ndarray: 2D array of sinusoidal values.
     """
-    # Create the sin input field
-    x = x / len(x) * 2 * np.pi
-    y = y / len(x) * 2 * np.pi
-
-    # Create the sin field. Divide by 2 since these will be added together
-    sin_x = np.sin(x) * np.cos(t) * 0.5
-    sin_y = np.cos(y) * np.sin(t) * 0.5
+    # Recompute the per-axis trig only when the coordinate arrays change. The coordinates drift uniformly (if at all),
+    # so the endpoints plus lengths are enough to detect a change.
+    key = (len(x), len(y), x[0], x[-1], y[0], y[-1])
+    if _sin_field_cache['key'] != key:
+        # Create the sin input field
+        _sin_field_cache['sin_x'] = np.sin(x / len(x) * 2 * np.pi)
+        _sin_field_cache['cos_y'] = np.cos(y / len(y) * 2 * np.pi)
+        _sin_field_cache['key'] = key
+
+    # Create the sin field. Divide by 2 since these will be added together. The scalars are cast to float32 so the
+    # whole field stays single precision when float32 coordinate arrays come in.
+    sin_x = _sin_field_cache['sin_x'] * np.float32(np.cos(t) * 0.5)
+    sin_y = _sin_field_cache['cos_y'] * np.float32(np.sin(t) * 0.5)
 
     field = sin_x[np.newaxis, :] + sin_y[:, np.newaxis]
     # Normalize the field to be in the range [0, 1]
-    return field * 0.5 + 0.5
+    return field * np.float32(0.5) + np.float32(0.5)
 
 # ------------------------------------------
 # Value maps
@@ -81,6 +168,8 @@ def sin_value_map(
     """
     def value_map(x:np.ndarray, y:np.ndarray, t:float) -> np.ndarray:
         values = field_map(x, y, t)
+        if _NUMBA_AVAILABLE:
+            return _sin_remap(values)
         # Need to modify the values to be in the input range of sin
         values = (values * 2 - 1) * np.pi
         return np.sin(values) * 0.5 + 0.5 # Shift the sin values to be in the range [0, 1]
@@ -99,13 +188,23 @@ def sigmoid_value_map(
         Callable[[np.ndarray, np.ndarray, float], np.ndarray]: The new field map function with the sigmoid applied.
     """
     def value_map(x:np.ndarray, y:np.ndarray, t:float) -> np.ndarray:
-        a = value_map.a # Get the method's a value
         values = field_map(x, y, t)
+        if _NUMBA_AVAILABLE:
+            return _sigmoid_remap(values, _a)
         # Remap the values to be in the range [-1, 1]
         values = values * 2 - 1
-        return 1 / (1 + np.exp(-a * values))
-    # Set the a value to the method
-    value_map.a = a
+        return 1 / (1 + np.exp(-_a * values))
+
+    def set_a(new_a: float) -> None:
+        """Sets the steepness value a. Stored in a closure cell so the per-frame path reads it without an attribute
+        lookup."""
+        nonlocal _a
+        _a = float(new_a)
+        value_map.a = _a
+
+    _a = None
+    value_map.set_a = set_a
+    set_a(a)
     return value_map
 
 def tan_value_map(
@@ -123,17 +222,26 @@ def tan_value_map(
         Callable[[np.ndarray, np.ndarray, float], np.ndarray]: The new field map function with the tan applied.
     """
     def value_map(x:np.ndarray, y:np.ndarray, t:float) -> np.ndarray:
-        a = value_map.a # Get the method's a value
-        # Create a "static" value a
         values = field_map(x, y, t)
+        if _NUMBA_AVAILABLE:
+            return _tan_remap(values, _a, _scaler)
         # Remap the values to be in the range [-1, 1]
         values = values * 2 - 1
-        a = np.clip(a, 0, np.pi/2)
+        return np.tan(_a * values) * _scaler * 0.5 + 0.5 # Shift the tan values to be in the range [0, 1]
+
+    def set_a(new_a: float) -> None:
+        """Sets the steepness value a, clipping it and recomputing the output scaler. These depend only on a, so they
+        are done here once instead of every frame."""
+        nonlocal _a, _scaler
+        _a = float(np.clip(new_a, 0, np.pi/2))
         # Calculate the scaler to use such that tan(a) is in the range [-1, 1]
-        scaler = 1 / np.tan(a)
-        return np.tan(a * values) * scaler * 0.5 + 0.5 # Shift the tan values to be in the range [0, 1]
-    # Set the a value to the method
-    value_map.a = a
+        _scaler = 1 / np.tan(_a)
+        value_map.a = _a
+
+    _a = None
+    _scaler = None
+    value_map.set_a = set_a
+    set_a(a)
     return value_map
 
 class ColorField(Framer):
@@ -183,6 +291,7 @@ class ColorField(Framer):
                 color_map (tuple[tuple], optional): The color map for the animation. Defaults to _DEFAULT_COLOR_MAP.
             """
             super().__init__()
+            _warm_up_opensimplex()
             self.field_function = field_function
             self._position_scaler = 1/zoom_factor
             self.temporal_speed = temporal_speed
@@ -202,28 +311,17 @@ class ColorField(Framer):
         Returns:
             tuple[np.ndarray, float]: The updated animation frame and the time elapsed.
         """
+        # NOTE: The noise -> remap -> color pipeline could be cache-blocked into row tiles to cut memory traffic, but
+        # at 50x124 the whole float32 field is ~24KB and every pass stays resident in L1/L2 anyway. Tiling would also
+        # force a row-range parameter into the field_function contract, so it's not worth it at this panel size.
+        # The same goes for a GPU (CuPy/CUDA) offload: per-pixel noise is embarrassingly parallel, but at 6200 pixels
+        # the kernel launch and transfer latency would dwarf the compute. Revisit both if the panel ever grows past
+        # roughly 128x128.
         self.matrix = self._value_to_color(self.field_function(self._positions.x, self._positions.y, self._positions.t))
 
-        # Update the positions
-        position_delta = self.spatial_speed * self.dt
-        match self.spatial_type:
-            case "meander":
-                dx = opensimplex.noise2(self._positions.t * self.meander_speed, 0) * position_delta
-                dy = opensimplex.noise2(self._positions.t * self.meander_speed, 
-                                        ColorField._MEANDER_SIMPLEX_SPACING) * position_delta
-                self._positions.x += dx
-                self._positions.y += dy
-                pass
-            case "linear_x":
-                self._positions.x += position_delta
-            case "linear_y":
-                self._positions.y += position_delta
-            case "linear_xy":
-                self._positions.x += position_delta
-                self._positions.y += position_delta
-            case "linear_xor":
-                self._positions.x -= position_delta
-                self._positions.y += position_delta
+        # Update the positions. The advance method is bound once in the spatial_type setter, so this is a single call
+        # instead of a per-frame string match.
+        self._advance(self.spatial_speed * self.dt)
 
         self._positions.t += self.dt * self.temporal_speed
         
@@ -234,16 +332,26 @@ class ColorField(Framer):
         Resets the animation to its initial state.
         """
         self.matrix = np.zeros((self.HEIGHT, self.WIDTH, 3), dtype=np.uint8)
+        # Scratch buffers reused by _value_to_color so the per-frame pipeline allocates nothing
+        self._value_scratch = np.empty((self.HEIGHT, self.WIDTH), dtype=np.float32)
+        self._index_scratch = np.empty((self.HEIGHT, self.WIDTH), dtype=np.intp)
+        # Positions are kept in float32: single precision is indistinguishable on an 8-bit panel and halves the
+        # bandwidth of every elementwise op in the field and value maps
         self._positions:ColorField.Positions = ColorField.Positions(
-            x=np.arange(0, self.WIDTH, 1) * self._position_scaler,
-            y=np.arange(0, self.HEIGHT, 1) * self._position_scaler,
+            x=_coord_base(self.WIDTH) * np.float32(self._position_scaler),
+            y=_coord_base(self.HEIGHT) * np.float32(self._position_scaler),
             t=0
         )
 
 
+    # Number of entries in the value -> color lookup table. 1024 value levels is well past what 8-bit channels can show.
+    _COLOR_LUT_SIZE = 1024
+
     def _value_to_color(self, value: np.ndarray) -> np.ndarray:
         """
-        Converts noise values to colors.
+        Converts noise values to colors by gathering from the gradient lookup table precomputed in the color_map
+        setter. The per-frame work is one scale + cast + table gather instead of a full piecewise-linear interpolation
+        per pixel.
 
         Args:
             value (np.ndarray): The noise values.
@@ -251,22 +359,103 @@ class ColorField(Framer):
         Returns:
             np.ndarray: The colors corresponding to the noise values.
         """
-        num_colors = len(self.color_map)
+        # NOTE: Packing the LUT as uint32 (one aligned load per pixel) was considered, but the frame contract is a
+        # contiguous (H, W, 3) uint8 matrix; unpacking the uint32 gather back to that layout costs an extra pass,
+        # while the 3KB uint8 LUT already sits in L1 and the gather below writes the final layout directly.
+        # Every step writes into a reused buffer (scale, truncating cast, clamp, gather) so nothing is allocated here
+        np.multiply(value, ColorField._COLOR_LUT_SIZE - 1, out=self._value_scratch)
+        self._index_scratch[...] = self._value_scratch # Truncating cast to integer indices
         # NOTE: take the min to prevent index out of bounds
-        first_color_indices = np.minimum(value * (num_colors - 1), num_colors - 2).astype(np.intc)
-        next_color_index  = first_color_indices + 1
+        np.minimum(self._index_scratch, ColorField._COLOR_LUT_SIZE - 1, out=self._index_scratch)
+        np.take(self._color_lut, self._index_scratch, axis=0, out=self.matrix)
+        return self.matrix
+
+    def _interpolate_colors(self, value: np.ndarray) -> np.ndarray:
+        """
+        Piecewise-linear interpolation of values in [0, 1] through the color map. Only used to build the gradient
+        lookup table; the per-frame path is _value_to_color.
+
+        NOTE: A numba kernel specialized per color-map length (unrolled segment ladder) was considered, but this
+        method now runs only when the color map changes, over just _COLOR_LUT_SIZE values. A JIT compile per map
+        length would cost far more than the vectorized interpolation it replaces.
+
+        Args:
+            value (np.ndarray): The values to interpolate, range [0, 1].
+
+        Returns:
+            np.ndarray: The interpolated colors.
+        """
+        num_colors = len(self.color_map)
+        first_color_indices = (value * (num_colors - 1)).astype(np.intp)
 
         value_spacing = 1 / (num_colors - 1)
         color_percentages = (value - first_color_indices * value_spacing) / value_spacing
 
-        first_color = self.color_map[first_color_indices]
-        next_color  = self.color_map[next_color_index]
+        # mode='clip' clamps inside the gather itself, so no np.minimum pass (and its float temporary) is needed to
+        # guard value == 1.0
+        first_color = np.take(self.color_map, first_color_indices, axis=0, mode='clip')
+        next_color  = np.take(self.color_map, first_color_indices + 1, axis=0, mode='clip')
 
         # Interpolate the colors
-        # NOTE: color_percentages is a HEIGHT x WIDTH array, so we need to broadcast it to HEIGHT x WIDTH x 3
-        color_percentages = color_percentages[:, :, np.newaxis]
+        # NOTE: color_percentages needs an extra axis to broadcast across the color channels
+        color_percentages = color_percentages[..., np.newaxis]
+
+        # Adding 0.5 before the truncating cast rounds correctly here (values are non-negative and <= 255) and skips
+        # the extra full-buffer pass that np.round would make
+        return (first_color * (1 - color_percentages) + next_color * color_percentages + 0.5).astype(np.uint8)
+
+    def _advance_meander(self, position_delta: float) -> None:
+        # Both meander offsets come from one batched noise2array call (a (2, 1) result) instead of two scalar noise2
+        # calls, so only one trip is made through opensimplex's Python wrapper per frame
+        offsets = opensimplex.noise2array(np.array([self._positions.t * self.meander_speed]),
+                                          np.array([0.0, ColorField._MEANDER_SIMPLEX_SPACING], dtype=np.float64))
+        self._positions.x += offsets[0, 0] * position_delta
+        self._positions.y += offsets[1, 0] * position_delta
 
-        return np.round(first_color * (1 - color_percentages) + next_color * color_percentages).astype(np.uint8)
+    def _advance_linear_x(self, position_delta: float) -> None:
+        self._positions.x += position_delta
+
+    def _advance_linear_y(self, position_delta: float) -> None:
+        self._positions.y += position_delta
+
+    def _advance_linear_xy(self, position_delta: float) -> None:
+        self._positions.x += position_delta
+        self._positions.y += position_delta
+
+    def _advance_linear_xor(self, position_delta: float) -> None:
+        self._positions.x -= position_delta
+        self._positions.y += position_delta
+
+    @property
+    def spatial_type(self) -> str:
+        """
+        The type of spatial animation.
+
+        Returns:
+            str: The spatial type.
+        """
+        return self._spatial_type
+
+    @spatial_type.setter
+    def spatial_type(self, value: str) -> None:
+        """
+        Sets the type of spatial animation and binds the matching advance method so update() dispatches with a single
+        call instead of matching the string every frame.
+
+        Args:
+            value (str): The spatial type. One of "meander", "linear_x", "linear_y", "linear_xy", or "linear_xor".
+        """
+        advance_methods = {
+            "meander": self._advance_meander,
+            "linear_x": self._advance_linear_x,
+            "linear_y": self._advance_linear_y,
+            "linear_xy": self._advance_linear_xy,
+            "linear_xor": self._advance_linear_xor,
+        }
+        if value not in advance_methods:
+            raise ValueError(f"Unknown spatial type: {value}")
+        self._spatial_type = value
+        self._advance = advance_methods[value]
 
     @property
     def zoom_factor(self) -> float:
@@ -312,5 +501,9 @@ class ColorField(Framer):
         """
         if len(value) < 2:
             raise ValueError("Color map must have at least 2 colors.")
-        self._color_map = [np.array(color) for color in value]
-        self._color_map = np.array(self._color_map, dtype=np.uint8)
+        # One conversion straight to the (N, 3) uint8 array; no intermediate list of per-color arrays
+        self._color_map = np.asarray(value, dtype=np.uint8)
+        if self._color_map.ndim != 2 or self._color_map.shape[1] != 3:
+            raise ValueError("Each color in the color map must have 3 (RGB) components.")
+        # Bake the gradient into a lookup table so _value_to_color is a pure gather per frame
+        self._color_lut = self._interpolate_colors(np.linspace(0, 1, ColorField._COLOR_LUT_SIZE))
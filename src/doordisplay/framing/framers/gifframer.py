@@ -38,8 +38,11 @@ class GifFramer(Framer):
             raise ValueError(f'File at {gif_path} is not a GIF')
         
         # Extract the frames. We could instead transform the GIF frame on every call to update() and not have to do all
-        # this quagmire, but this reduces the overhead of that function
-        self.frames = []
+        # this quagmire, but this reduces the overhead of that function. The frames are decoded straight into one
+        # contiguous (N, HEIGHT, WIDTH, 3) array here so update() is just an O(1) view into it, with no per-frame
+        # PIL-to-numpy conversion or copy.
+        frames = []
+        durations_s = []
         for i in range(self.num_frames):
             gif.seek(i)
             frame = gif.copy().convert('RGB')
@@ -51,7 +54,10 @@ class GifFramer(Framer):
             # Get the duration of the frame. If the GIF doesn't have a duration, we'll use the given framerate
             # NOTE: framerate is not self.framerate, which is currently hardcoded to 60
             duration_ms = gif.info.get('duration') or (1 / framerate) * 1000
-            self.frames.append({'frame': frame, 'duration_s': duration_ms / 1000})
+            frames.append(np.asarray(frame, dtype=np.uint8))
+            durations_s.append(duration_ms / 1000)
+        self._frames_np = np.stack(frames)
+        self._durations_s = np.array(durations_s, dtype=np.float64)
 
     def update(self):
         """
@@ -75,8 +81,9 @@ class GifFramer(Framer):
                     # Stop playing
                     return (None, 0)
 
-        self.matrix = np.array(self.frames[self.frame_idx]['frame'])
-        self.dt = self.frames[self.frame_idx]['duration_s']
+        # An O(1) view into the frame stack decoded in __init__; nothing is allocated or copied here
+        self.matrix = self._frames_np[self.frame_idx]
+        self.dt = float(self._durations_s[self.frame_idx])
         self.frame_idx += 1 if self.play_forward else -1
         return super().update()
 
@@ -4,10 +4,32 @@ import numpy as np
 from pathlib import Path
 from framing.utils import scale_fit, clip, shift
 from typing import List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import random
 from enum import Enum
 import time
 
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError: # pragma: no cover - numba is pinned in requirements, but keep it a soft dependency
+    _NUMBA_AVAILABLE = False
+
+if _NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _fade_blend(dst, src, out, alpha_q8):
+        """
+        Numba kernel for the fade blend: out = (src*alpha + dst*(256-alpha)) >> 8 in one fused pass, one load of each
+        input and one store per pixel instead of the several full-buffer passes the NumPy expression makes. Writing out
+        over dst is safe since each element depends only on itself.
+        """
+        inv_alpha = 256 - alpha_q8
+        for i in prange(dst.shape[0]):
+            for j in range(dst.shape[1]):
+                for c in range(3):
+                    out[i, j, c] = (src[i, j, c] * alpha_q8 + dst[i, j, c] * inv_alpha) >> 8
+
 class TransitionType(Enum):
     NONE = 1
     SIMPLE_LR = 2
@@ -29,67 +51,120 @@ class SlideshowFramer(Framer):
         self.image_paths = image_paths
         self.shuffle = shuffle
         self.matrix = np.zeros((self.HEIGHT, self.WIDTH, 3), dtype=np.uint8)
+        # Reused uint16 scratch buffers for the fixed-point fade blend; allocated once so the fade makes no per-frame
+        # float temporaries
+        self._blend_buf = np.empty((self.HEIGHT, self.WIDTH, 3), dtype=np.uint16)
+        self._blend_scratch = np.empty((self.HEIGHT, self.WIDTH, 3), dtype=np.uint16)
+        if _NUMBA_AVAILABLE:
+            # Warm the JIT here so the first fade frame doesn't pay the compile cost
+            tiny = np.zeros((1, 1, 3), dtype=np.uint8)
+            _fade_blend(tiny, tiny, tiny, 128)
         self.display_duration = display_duration
         self.global_transition_type = transition_type
         self.transition_type = transition_type
         self.transition_duration = transition_duration
         self.transition_position = 0.0
+        # Leading edge of the previous frame's left-right wipe, so each frame copies only the newly revealed columns
+        self._prev_shift_index = 0
         self.image_path_indicies = []
         self.update_indicies()
+
+        # Decoded slide cache, filled in the background so transitions never stall on Image.open + resample. A few
+        # workers decode concurrently (PIL releases the GIL inside libjpeg/libpng), warming the cache several times
+        # faster than a single thread. _load_next_image decodes synchronously on a cache miss; list item writes are
+        # atomic under the GIL so no lock is needed. Cached arrays are treated as read-only.
+        self._slide_cache: list[np.ndarray | None] = [None] * len(image_paths)
+        self._fill_slide_cache()
+
         self.next_image = self._load_next_image()
         
         if self.global_transition_type == TransitionType.RANDOM:
             self.transition_type = self._choose_random_transition()
         
     def update_indicies(self):
+        # A deque makes pulling the next index O(1); list.pop(0) shifts the whole list every transition
         if self.shuffle:
-            self.image_path_indicies = random.sample(range(0, len(self.image_paths)), len(self.image_paths))
+            self.image_path_indicies = deque(random.sample(range(0, len(self.image_paths)), len(self.image_paths)))
         else:
-            self.image_path_indicies = list(range(len(self.image_paths)))
+            self.image_path_indicies = deque(range(len(self.image_paths)))
 
     def update(self):
-        
-        if(self.transition_type == TransitionType.NONE):
-            self._update_image_no_transition()
-
-        elif(self.transition_type == TransitionType.SIMPLE_LR):
-            self._update_image_left_right() 
-
-        elif(self.transition_type == TransitionType.SIMPLE_RL):
-            self._update_image_right_left()
-
-        elif(self.transition_type == TransitionType.SIMPLE_UD):
-            self._update_image_up_down()
-
-        elif(self.transition_type == TransitionType.SIMPLE_DU):
-            self._update_image_down_up()
-
-        elif(self.transition_type == TransitionType.SIMPLE_FADE):
-            self._update_image_fade()
-              
+        # The transition method is bound once in the transition_type setter; no per-frame enum compare chain
+        self._transition_fn()
         return super().update()
+
+    @property
+    def transition_type(self) -> TransitionType:
+        return self._transition_type
+
+    @transition_type.setter
+    def transition_type(self, value: TransitionType):
+        transition_fns = {
+            TransitionType.NONE: self._update_image_no_transition,
+            TransitionType.SIMPLE_LR: self._update_image_left_right,
+            TransitionType.SIMPLE_RL: self._update_image_right_left,
+            TransitionType.SIMPLE_UD: self._update_image_up_down,
+            TransitionType.SIMPLE_DU: self._update_image_down_up,
+            TransitionType.SIMPLE_FADE: self._update_image_fade,
+        }
+        self._transition_type = value
+        # NOTE: RANDOM has no method of its own; it's resolved to a concrete transition (in __init__ and
+        # _end_transition) before update() ever runs
+        self._transition_fn = transition_fns.get(value)
     
     def reset(self):
-        self.matrix = np.zeros((self.HEIGHT, self.WIDTH, 3), dtype=np.uint8)
+        # Clear the existing buffer in place rather than allocating a new one
+        self.matrix.fill(0)
         self.update_indicies()
         self.transition_position = 0.0
+        self._prev_shift_index = 0
         self.next_image = self._load_next_image()
 
-    def _load_next_image(self) -> np.ndarray:
-        # Open the next image
-        image_path = self.image_paths[self.image_path_indicies.pop(0)]
-        image = Image.open(image_path)
-        
+    def _decode_image(self, idx: int) -> np.ndarray:
+        # NOTE: A disk cache of resized arrays (keyed by path/mtime/size) was considered so restarts skip the PIL
+        # decode+resize, but each slide is decoded once per process by the background fill thread and a 50x124 frame
+        # decodes in low milliseconds - not worth scattering .npy files into a cache directory.
+        # Open, scale, and convert one slide to a contiguous uint8 array
+        image = Image.open(self.image_paths[idx])
+
         if self.auto_scale:
             image = scale_fit(image, self.WIDTH, self.HEIGHT)
         else:
             image = clip(image, self.WIDTH, self.HEIGHT)
 
+        # Force 3-channel RGB: a PNG with alpha (or a palette GIF) would otherwise decode to a 4- or 1-channel array
+        # and break the (H, W, 3) slice copies in the transitions
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+
+        return np.ascontiguousarray(np.asarray(image, dtype=np.uint8))
+
+    def _fill_slide_cache(self):
+        # Decode in upcoming display order (the indices list is already shuffled when shuffle is on) so the earliest
+        # transitions hit warm cache entries. shutdown(wait=False) lets the workers finish in the background and then
+        # tear themselves down.
+        pool = ThreadPoolExecutor(max_workers=min(4, max(1, len(self.image_paths))))
+        for idx in self.image_path_indicies:
+            pool.submit(self._fill_cache_entry, idx)
+        pool.shutdown(wait=False)
+
+    def _fill_cache_entry(self, idx: int):
+        if self._slide_cache[idx] is None:
+            self._slide_cache[idx] = self._decode_image(idx)
+
+    def _load_next_image(self) -> np.ndarray:
+        # Grab the next slide from the cache, decoding it here only if the background fill hasn't reached it yet
+        idx = self.image_path_indicies.popleft()
+        image_array = self._slide_cache[idx]
+        if image_array is None:
+            image_array = self._decode_image(idx)
+            self._slide_cache[idx] = image_array
+
         #Reset the shuffled list once it's empty
         if not self.image_path_indicies:
             self.update_indicies()
 
-        return np.array(image)
+        return image_array
     
     def _choose_random_transition(self) -> TransitionType:
         return random.choice([e for e in TransitionType if e != TransitionType.NONE 
@@ -99,6 +174,7 @@ class SlideshowFramer(Framer):
         #reset the index and end update the duration
         self.dt = self.display_duration
         self.transition_position = 0.0
+        self._prev_shift_index = 0
         self.next_image = self._load_next_image()
 
         if self.global_transition_type == TransitionType.RANDOM:
@@ -111,9 +187,10 @@ class SlideshowFramer(Framer):
         
             
     def _update_image_no_transition(self):
-        #load the new image
+        #load the new image. Copying into the preallocated buffer (instead of rebinding to the cached array) keeps
+        #self.matrix stable and the cache entries untouched by any later transition writes
         self.dt = self.display_duration
-        self.matrix = self._load_next_image()
+        np.copyto(self.matrix, self._load_next_image())
 
     def _update_image_left_right(self):
         #start the transition
@@ -121,10 +198,12 @@ class SlideshowFramer(Framer):
             self.dt = 1 / Framer.DEFAULT_FRAMERATE
         
         shift_index = round(self.transition_position * self.WIDTH)
-        
-        # Copy columns from the new image to the existing image
-        self.matrix[:, :shift_index] = self.next_image[:, :shift_index]
-    
+
+        # Copy only the newly revealed columns from the new image; the earlier ones are already in place. Over a whole
+        # transition this copies each column once instead of re-copying the growing rectangle every frame.
+        self.matrix[:, self._prev_shift_index:shift_index] = self.next_image[:, self._prev_shift_index:shift_index]
+        self._prev_shift_index = shift_index
+
         #calcualte new transition position
         self._increment_position()
 
@@ -138,8 +217,10 @@ class SlideshowFramer(Framer):
             self.dt = 1 / Framer.DEFAULT_FRAMERATE
 
         shift_index = round(self.transition_position * self.WIDTH)
-         
+
         # Copy columns from the new image to the existing image
+        # NOTE: This can't delta-copy like the left-right wipe: the new image slides in, so every column in the band
+        # shows different content each frame and has to be rewritten
         self.matrix[:, self.WIDTH - shift_index:] = self.next_image[:, :shift_index]
 
         #calcualte new transition position
@@ -173,8 +254,13 @@ class SlideshowFramer(Framer):
 
         shift_index = round(self.transition_position * self.HEIGHT)
 
-        # Copy columns from the new image to the existing image
-        self.matrix[:shift_index :] = self.next_image[:shift_index, :]
+        # Reveal the new image upward from the bottom (the old slice was missing its comma and copied top rows, which
+        # made this a duplicate of a top-down reveal rather than the down-up its name promises). Rows land in their
+        # final position, so only the newly revealed band needs copying each frame.
+        row_start = self.HEIGHT - shift_index
+        row_end = self.HEIGHT - self._prev_shift_index
+        self.matrix[row_start:row_end, :] = self.next_image[row_start:row_end, :]
+        self._prev_shift_index = shift_index
 
         #calcualte new transition position
         self._increment_position()
@@ -186,16 +272,30 @@ class SlideshowFramer(Framer):
     def _update_image_fade(self):
         if self.transition_position == 0:
             self.dt = 1 / Framer.DEFAULT_FRAMERATE
-
-        # Calculate blend factor based on shift index
-        blend_factor = self.transition_position
-        
-        # Blend the two images together
-        self.matrix = (1 - blend_factor) * self.matrix + blend_factor * self.next_image
+            # Bake the quantized alpha ramp for the whole transition up front; duration and frame cadence are fixed
+            # while it runs, so each frame just reads the next entry instead of rederiving the blend factor
+            num_steps = max(1, round(self.transition_duration * Framer.DEFAULT_FRAMERATE))
+            self._alpha_schedule = (np.arange(num_steps + 1) / num_steps * 256).round().astype(np.intp)
+            self._alpha_idx = 0
+
+        # Blend the two images together in fixed point (8 fractional bits). The old float expression promoted both
+        # uint8 buffers to float64 and allocated two temporaries every frame; this stays in uint16 scratch buffers.
+        alpha = int(self._alpha_schedule[min(self._alpha_idx, len(self._alpha_schedule) - 1)])
+        self._alpha_idx += 1
+        if _NUMBA_AVAILABLE:
+            # One fused pass over the pixels; see _fade_blend
+            _fade_blend(self.matrix, self.next_image, self.matrix, alpha)
+        else:
+            np.multiply(self.next_image, np.uint16(alpha), out=self._blend_buf, casting='unsafe')
+            np.multiply(self.matrix, np.uint16(256 - alpha), out=self._blend_scratch, casting='unsafe')
+            self._blend_buf += self._blend_scratch
+            self._blend_buf >>= 8
+            # Narrowing copy back into the preallocated frame buffer; no rebinding, no fresh uint8 allocation
+            np.copyto(self.matrix, self._blend_buf, casting='unsafe')
 
         #calcualte new transition position
         self._increment_position()
 
-        # End the transition
-        if blend_factor == 1.0:
+        # End the transition once the fully-opaque entry has been blended
+        if alpha == 256:
             self._end_transition()
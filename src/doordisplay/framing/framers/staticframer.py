@@ -2,7 +2,7 @@ from framing.framers.framer import Framer
 from PIL import Image
 import numpy as np
 from pathlib import Path
-from framing.utils import scale_fit, clip
+from framing.utils import scale_fit, clip_ndarray
 
 class StaticFramer(Framer):
     def __init__(self, image_path:str | Path, auto_scale:bool = True):
@@ -25,18 +25,31 @@ class StaticFramer(Framer):
 
         if self.auto_scale:
             image = scale_fit(image, self.WIDTH, self.HEIGHT)
+            image_array = np.asarray(image)
         else:
-            image = clip(image, self.WIDTH, self.HEIGHT)
+            # Clip as an ndarray view instead of going through a PIL crop allocation
+            if image.mode != 'RGB':
+                image = image.convert('RGB')
+            image_array = clip_ndarray(np.asarray(image), self.WIDTH, self.HEIGHT)
 
-        # Convert the image to an array
-        image_array = np.array(image)
+        # If the image covers the whole frame there's no border to letterbox; use it directly
+        if image_array.shape[0] == self.HEIGHT and image_array.shape[1] == self.WIDTH:
+            self.matrix = np.ascontiguousarray(image_array)
+            return
 
         # Calculate the starting position for placing the image in the frame matrix
         start_row = (self.HEIGHT - image_array.shape[0]) // 2
         start_col = (self.WIDTH - image_array.shape[1]) // 2
-
-        # Create the frame matrix
-        frame_matrix = np.zeros((self.HEIGHT, self.WIDTH, 3), dtype=np.uint8)
-        frame_matrix[start_row:start_row+image_array.shape[0], start_col:start_col+image_array.shape[1]] = image_array
+        end_row = start_row + image_array.shape[0]
+        end_col = start_col + image_array.shape[1]
+
+        # Create the frame matrix. np.empty plus zeroing just the four border bands skips the full-frame memset that
+        # np.zeros would do before most of it gets overwritten by the image anyway
+        frame_matrix = np.empty((self.HEIGHT, self.WIDTH, 3), dtype=np.uint8)
+        frame_matrix[start_row:end_row, start_col:end_col] = image_array
+        frame_matrix[:start_row] = 0
+        frame_matrix[end_row:] = 0
+        frame_matrix[start_row:end_row, :start_col] = 0
+        frame_matrix[start_row:end_row, end_col:] = 0
 
         self.matrix = frame_matrix
@@ -15,6 +15,7 @@ class LEDMatrix:
         HEIGHT (int): The height of the LED matrix.
         RGB_ORDER (list): The order of RGB channels in the LED matrix.
         BLANK_PIXELS (list): Array of row, col indices of pixels that should be blanked out.
+        BLANK_PIXEL_IDS (frozenset): Flat row*WIDTH + col ids of the blanked pixels, for O(1) membership tests.
         NUM_BANKS (int): The number of banks in the LED matrix.
         COLUMNS_PER_BANK (int): The number of columns per bank in the LED matrix.
         NUM_LEDS (int): The total number of LEDs in the LED matrix.
@@ -40,6 +41,11 @@ class LEDMatrix:
                     (66, 45), (66, 46), (66, 47), (66, 48), (66, 49), 
                               (67, 46), (67, 47), (67, 48), (67, 49),
                     ]
+    # Flat row*WIDTH + col ids of the blanked pixels for O(1) membership tests. generate_idx_map builds its own
+    # boolean mask, but any runtime caller asking "is this pixel blanked?" should probe this instead of scanning the
+    # list above. (Computed via numpy rather than a comprehension because class-scope names like WIDTH aren't visible
+    # inside a comprehension body.)
+    BLANK_PIXEL_IDS = frozenset((np.asarray(BLANK_PIXELS) @ np.array([WIDTH, 1])).tolist())
     NUM_BANKS = 13
     COLUMNS_PER_BANK = 4
     NUM_LEDS = WIDTH * HEIGHT - len(BLANK_PIXELS)
@@ -58,12 +64,24 @@ class LEDMatrix:
             gamma (float, optional): The gamma correction value for the LED matrix. Defaults to 2.4.
         """
         self.idx_map = LEDMatrix.generate_idx_map()
+        # Flattened version of the index map: one contiguous gather over matrix.reshape(-1) instead of three parallel
+        # fancy-index arrays (a third of the index traffic per frame)
+        self._flat_idx_map = (self.idx_map[:, 0] * (LEDMatrix.WIDTH * 3)
+                              + self.idx_map[:, 1] * 3
+                              + self.idx_map[:, 2])
         self.serial_port = serial_port if serial_port is not None else LEDMatrix.get_teensy_serial()
         self._brightness = brightness
         self._contrast = contrast
         self._gamma = gamma
         self.gamma_lut = LEDMatrix.gen_gamma_lut(gamma)
         self.pixel_data = np.zeros((LEDMatrix.NUM_LEDS*3), dtype=np.uint8)
+        # One transmit buffer holding SOF flag + corrected pixel data, so each frame goes out as a single
+        # serial_port.write (one syscall) instead of a 1-byte SOF write followed by the data write. The corrected
+        # pixels are gathered straight into the view after the flag byte.
+        self._tx_buf = np.empty(1 + LEDMatrix.NUM_LEDS*3, dtype=np.uint8)
+        self._tx_buf[0] = LEDMatrix.SOF_FLAG[0]
+        self._corrected_buf = self._tx_buf[1:]
+        self._update_color_lut()
 
     def generate_idx_map() -> np.ndarray:
         """Generates an index map for mapping a 3D matrix to a 1D array of data. The returned array is of shape 
@@ -73,33 +91,43 @@ class LEDMatrix:
         Returns:
             np.ndarray: An array of indices that flattens a 3D matrix into a 1D array of pixel data.
         """
-        idx_map_len = LEDMatrix.NUM_LEDS * 3
-        idx_map = np.zeros((idx_map_len, 3), dtype=np.intp)
-        map_idx = 0 # This is confusing naming. This is the index of the idx_map array, not the index of the matrix
-        for col in range(LEDMatrix.WIDTH):
-            # LED strips are mounted with data starting at lower left of door, going up. There are 4 strips per bank,
-            # so the "strip" as the teensy sees it will be 4 columns wide, meaning every even column starts at the
-            # bottom of the matrix and every odd column starts at the top of the matrix.
-            # Data Dir: ↑ ↓ ↑ ↓  ↑ ↓ ↑ ↓  ↑ ↓ ↑ ↓  ...  ↑ ↓ ↑ ↓
-            #           ■ ■ ■ ■  ■ ■ ■ ■  ■ ■ ■ ■  ...  ■ ■ ■ ■
-            #           ■ ■ ■ ■  ■ ■ ■ ■  ■ ■ ■ ■  ...  ■ ■ ■ ■
-            #           ■ ■ ■ ■  ■ ■ ■ ■  ■ ■ ■ ■  ...  ■ ■ ■ ■
-            #           . . . .  . . . .  . . . .  ...  . . . .
-            #           . . . .  . . . .  . . . .  ...  . . . .
-            #           . . . .  . . . .  . . . .  ...  . . . .
-            #           ■ ■ ■ ■  ■ ■ ■ ■  ■ ■ ■ ■  ...  ■ ■ ■ ■
-            #           ■ ■ ■ ■  ■ ■ ■ ■  ■ ■ ■ ■  ...  ■ ■ ■ ■
-            # Data Dir: ↑ ↓ ↑ x  ↑ ↓ ↑ x  ↑ ↓ ↑ x  ...  ↑ ↓ ↑ x
-            # NOTE: Rows will be reversed for odd columns
-            rows = range(LEDMatrix.HEIGHT-1, -1, -1) if col % 2 == 0 else range(LEDMatrix.HEIGHT)
-            for row in rows:
-                if (row, col) in LEDMatrix.BLANK_PIXELS:
-                    continue
-                idx_map[map_idx]   = [row, col, LEDMatrix.RGB_ORDER[0]]
-                idx_map[map_idx+1] = [row, col, LEDMatrix.RGB_ORDER[1]]
-                idx_map[map_idx+2] = [row, col, LEDMatrix.RGB_ORDER[2]]
-                map_idx += 3
-        
+        # LED strips are mounted with data starting at lower left of door, going up. There are 4 strips per bank,
+        # so the "strip" as the teensy sees it will be 4 columns wide, meaning every even column starts at the
+        # bottom of the matrix and every odd column starts at the top of the matrix.
+        # Data Dir: ↑ ↓ ↑ ↓  ↑ ↓ ↑ ↓  ↑ ↓ ↑ ↓  ...  ↑ ↓ ↑ ↓
+        #           ■ ■ ■ ■  ■ ■ ■ ■  ■ ■ ■ ■  ...  ■ ■ ■ ■
+        #           ■ ■ ■ ■  ■ ■ ■ ■  ■ ■ ■ ■  ...  ■ ■ ■ ■
+        #           ■ ■ ■ ■  ■ ■ ■ ■  ■ ■ ■ ■  ...  ■ ■ ■ ■
+        #           . . . .  . . . .  . . . .  ...  . . . .
+        #           . . . .  . . . .  . . . .  ...  . . . .
+        #           . . . .  . . . .  . . . .  ...  . . . .
+        #           ■ ■ ■ ■  ■ ■ ■ ■  ■ ■ ■ ■  ...  ■ ■ ■ ■
+        #           ■ ■ ■ ■  ■ ■ ■ ■  ■ ■ ■ ■  ...  ■ ■ ■ ■
+        # Data Dir: ↑ ↓ ↑ x  ↑ ↓ ↑ x  ↑ ↓ ↑ x  ...  ↑ ↓ ↑ x
+        # NOTE: Rows will be reversed for odd columns
+        # The whole map is built with vector ops: a (WIDTH, HEIGHT) grid of serpentine row orders, a boolean mask for
+        # the blanked pixels (instead of an O(len(BLANK_PIXELS)) list scan per pixel), and a repeat/tile for the RGB
+        # channel triplets.
+        cols = np.arange(LEDMatrix.WIDTH)
+        rows_fwd = np.arange(LEDMatrix.HEIGHT)
+        rows = np.where((cols % 2 == 0)[:, np.newaxis], rows_fwd[::-1][np.newaxis, :], rows_fwd[np.newaxis, :])
+
+        row_order = rows.reshape(-1)
+        col_order = np.repeat(cols, LEDMatrix.HEIGHT)
+
+        blank_mask = np.zeros((LEDMatrix.HEIGHT, LEDMatrix.WIDTH), dtype=bool)
+        blank_rows, blank_cols = zip(*LEDMatrix.BLANK_PIXELS)
+        blank_mask[list(blank_rows), list(blank_cols)] = True
+
+        keep = ~blank_mask[row_order, col_order]
+        row_order = row_order[keep]
+        col_order = col_order[keep]
+
+        idx_map = np.empty((LEDMatrix.NUM_LEDS * 3, 3), dtype=np.intp)
+        idx_map[:, 0] = np.repeat(row_order, 3)
+        idx_map[:, 1] = np.repeat(col_order, 3)
+        idx_map[:, 2] = np.tile(np.asarray(LEDMatrix.RGB_ORDER, dtype=np.intp), LEDMatrix.NUM_LEDS)
+
         return idx_map
 
     def map_matrix(self, matrix: np.ndarray) -> np.ndarray:
@@ -111,7 +139,19 @@ class LEDMatrix:
         Returns:
             np.ndarray: 1D array of pixel data to be sent to the LED strip.
         """
-        return matrix[self.idx_map[:, 0], self.idx_map[:, 1], self.idx_map[:, 2]]
+        # NOTE: Framers hand over plain row-major (HEIGHT, WIDTH, 3) matrices and this single gather reorders into the
+        # strip's serpentine-column scan order. Tiling the frame buffers to match scan-out (as HUB75-style drivers do)
+        # would just move this same reorder into every framer; one fancy-index over ~18KB is already L2-resident.
+        # A planar (SoA) staging layout was also considered - three per-channel gathers plus three strided interleaves
+        # into the transmit buffer - but the correction LUT is dtype-blind (one byte gather regardless of layout), so
+        # the split only adds passes over the same 18KB. The single flat gather straight into scan order stays.
+        flat = matrix.reshape(-1)
+        if matrix.dtype == np.uint8:
+            # Gather straight into the persistent pixel buffer; no intermediate array per frame
+            np.take(flat, self._flat_idx_map, out=self.pixel_data)
+            return self.pixel_data
+        # Non-uint8 input (nothing in-tree sends one anymore): gather into a fresh array and let send_pixels narrow it
+        return flat[self._flat_idx_map]
     
     def send_pixels(self, pixels: list | np.ndarray):
         """Send the pixel data to the teensy.
@@ -119,12 +159,13 @@ class LEDMatrix:
         Args:
             pixels (list | np.ndarray): 1D array of length NUM_LEDS*3 of pixel data to be sent to the LED strip.
         """
-        # Apply the color correction
-        self.pixel_data[:] = pixels
-        pixel_data_corrected = self._apply_color_correction(self.pixel_data)
-
-        self.serial_port.write(LEDMatrix.SOF_FLAG)
-        self.serial_port.write(pixel_data_corrected)
+        # Keep the latest pixels around for refresh(); skip the copy when map_matrix already gathered into the buffer
+        if pixels is not self.pixel_data:
+            self.pixel_data[:] = pixels
+        # Apply the color correction; this fills the data portion of the transmit buffer, which already starts with
+        # the SOF flag, so the whole frame ships in one write
+        self._apply_color_correction(self.pixel_data)
+        self.serial_port.write(memoryview(self._tx_buf))
 
 
 
@@ -153,14 +194,34 @@ class LEDMatrix:
         Returns:
             np.ndarray: The adjusted matrix.
         """
+        # The whole contrast/brightness/gamma chain is a pure byte-to-byte function, so it's baked into a single
+        # 256-entry table (rebuilt by the setters) and applied as one gather into a reused buffer. The old float
+        # pipeline made three full-length float64 passes plus two rounding casts per frame.
+        if self._color_lut_is_identity:
+            # All three parameters are at their neutral values; a straight copy into the transmit buffer beats even
+            # the table gather (the copy can't be skipped outright - the corrected buffer is the data portion of the
+            # combined SOF + pixels transmit buffer)
+            self._corrected_buf[:] = pixel_data
+        else:
+            np.take(self._color_lut, pixel_data, out=self._corrected_buf)
+        return self._corrected_buf
+
+    def _update_color_lut(self):
+        """Rebuilds the fused contrast/brightness/gamma lookup table. Runs the original float pipeline over all 256
+        possible byte values once, so applying it per frame is a single table gather with identical output.
+        """
+        values = np.arange(256)
         # Apply the contrast
-        corrected = self._contrast * (pixel_data - 255*0.5) + 255*0.5
+        corrected = self._contrast * (values - 255*0.5) + 255*0.5
         corrected = np.clip(corrected, 0, 255)
         # Apply the brightness
         corrected = corrected * self._brightness
         # Apply the gamma
-        corrected = self.gamma_lut[corrected.round().astype(np.uint8)]
-        return corrected.round().astype(np.uint8)
+        self._color_lut = self.gamma_lut[corrected.round().astype(np.uint8)]
+        # Neutral parameters make the table the identity map; _apply_color_correction then copies instead of
+        # gathering. Checked on the baked table rather than the parameters so any future pipeline stage that happens
+        # to cancel out also qualifies.
+        self._color_lut_is_identity = bool(np.array_equal(self._color_lut, np.arange(256, dtype=np.uint8)))
 
     @classmethod
     def get_teensy_serial(cls) -> serial.Serial:
@@ -208,6 +269,7 @@ class LEDMatrix:
             value (float): The brightness scale value to set.
         """
         self._brightness = value
+        self._update_color_lut()
     
     @property
     def contrast(self) -> float:
@@ -222,6 +284,7 @@ class LEDMatrix:
             value (float): The contrast scale value to set.
         """
         self._contrast = value
+        self._update_color_lut()
 
     @property
     def gamma(self) -> float:
@@ -237,3 +300,4 @@ class LEDMatrix:
         """
         self._gamma = value
         self.gamma_lut = LEDMatrix.gen_gamma_lut(value)
+        self._update_color_lut()
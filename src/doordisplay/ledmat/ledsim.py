@@ -55,10 +55,42 @@ class LEDSimulator(LEDMatrix):
         self.height = LEDMatrix.HEIGHT * self.scale
         self.screen = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
         self.window_title = "The Door Simulator - FPS: {:.2f}"
-        pygame.display.set_caption(self.window_title.format(0))
+        # Bound format method so the template isn't re-parsed per update, and a timestamp so the caption (a
+        # window-manager round trip) is refreshed at most twice a second rather than every frame
+        self._caption_fmt = self.window_title.format
+        self._last_caption_time = 0.0
+        pygame.display.set_caption(self._caption_fmt(0))
         self.clock = pygame.time.Clock()
-        
-        self.frame = np.zeros((LEDMatrix.WIDTH, LEDMatrix.HEIGHT, 3), dtype=np.uint8)
+        self._closed = False
+
+        # Persistent source surface for the frame scatter; write() scales it straight onto the screen surface, so no
+        # per-frame Surface allocations and no intermediate blit. Converting to the display's pixel format up front
+        # keeps every scale/blit on SDL's fast same-format path instead of converting per frame; the scatter index
+        # below is built from the converted surface's layout, so a BGR or shifted display format works transparently.
+        # The display format doesn't change on VIDEORESIZE, so no re-convert is needed there.
+        self._src_surf = pygame.Surface((LEDMatrix.WIDTH, LEDMatrix.HEIGHT)).convert(self.screen)
+
+        # Zero-copy staging: frames scatter straight into the source surface's SDL pixel memory through a flat byte
+        # view, so there's no intermediate frame array or blit_array copy at all. The scatter index is built from the
+        # surface's actual pitch, bytes-per-pixel, and channel bit shifts (a 32-bit software surface is contiguous:
+        # pitch == width * 4). Holding the buffer keeps the surface "locked", which is harmless for a software
+        # surface - transform.scale still reads it fine.
+        try:
+            self._frame_flat = np.frombuffer(self._src_surf.get_view('0'), dtype=np.uint8)
+        except ValueError:
+            # A 24-bit display format can pad rows past the pixel data, making the buffer non-contiguous. Fall back
+            # to a plain 32-bit staging surface; SDL then converts once per scale instead of never, which still
+            # beats converting per blit.
+            self._src_surf = pygame.Surface((LEDMatrix.WIDTH, LEDMatrix.HEIGHT))
+            self._frame_flat = np.frombuffer(self._src_surf.get_view('0'), dtype=np.uint8)
+        pitch = self._src_surf.get_pitch()
+        bytes_per_pixel = self._src_surf.get_bytesize()
+        # Byte offset of each RGB channel within a pixel, from the surface's bit shifts (little-endian)
+        channel_offsets = np.array(self._src_surf.get_shifts()[:3], dtype=np.intp) // 8
+        # idx_map columns are (row, col, channel) in strip order; surfarray's x axis is the matrix column
+        self._flat_scatter_idx = (self.idx_map[:, 0] * pitch
+                                  + self.idx_map[:, 1] * bytes_per_pixel
+                                  + channel_offsets[self.idx_map[:, 2]]).astype(np.intp)
 
     def update(self):
         """
@@ -73,9 +105,19 @@ class LEDSimulator(LEDMatrix):
         Returns:
             None
         """
+        self.pump_events()
+        self.clock.tick(self.DEFAULT_MAX_FPS)
+
+    def pump_events(self):
+        """
+        Drain the pygame event queue, handling quit and window-resize events. Called from update(), which runs at
+        display cadence (<= DEFAULT_MAX_FPS via the clock tick) - the serial-write path deliberately does no event
+        polling, since event.get() allocates an event object for everything pending and writes can arrive much
+        faster than the display updates.
+        """
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                pygame.quit()
+                self.close()
                 exit()
             elif event.type == pygame.VIDEORESIZE:
                 new_height = event.h
@@ -86,10 +128,21 @@ class LEDSimulator(LEDMatrix):
                 self.scale = new_width / LEDMatrix.WIDTH
                 self.screen = pygame.display.set_mode((new_width, new_height), pygame.RESIZABLE)
 
-        self.clock.tick(self.DEFAULT_MAX_FPS)
+    def close(self):
+        """
+        Shut down the simulator window. Safe to call more than once. Explicit teardown instead of __del__: __del__
+        fires at whatever point the garbage collector gets around to it - possibly during interpreter shutdown after
+        pygame's C state is already gone, or mid-benchmark while a previous simulator is still being collected.
+        """
+        if not self._closed:
+            self._closed = True
+            pygame.quit()
+
+    def __enter__(self):
+        return self
 
-    def __del__(self):
-        pygame.quit()
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
         
 class LEDSerialPortSimulator:
@@ -108,6 +161,14 @@ class LEDSerialPortSimulator:
 
     def __init__(self, led_simulator: LEDSimulator) -> None:
         self.led_simulator = led_simulator
+        # Bytes of the last frame drawn, so identical frames (StaticFramer resends, color-correction refreshes with
+        # nothing changed) skip the scatter/scale/flip pipeline entirely
+        self._last_frame_bytes = None
+        # Writes can arrive faster than the display refreshes (the real Teensy absorbs them; a rescale+flip doesn't).
+        # Renders are capped to the display cadence; early writes are coalesced and the next on-time write paints the
+        # latest frame.
+        self._min_render_interval = 1.0 / LEDSimulator.DEFAULT_MAX_FPS
+        self._next_render_time = 0.0
 
     def write(self, pixel_data) -> int:
         """
@@ -119,27 +180,55 @@ class LEDSerialPortSimulator:
         Returns:
             None
         """
-        if len(pixel_data) == 1 and pixel_data == self.led_simulator.SOF_FLAG:
-            # write() normally returns the number of bytes written, which would be one in this case.
-            return 1
-
-        self.led_simulator.screen.fill((0, 0, 0))  # Clear the screen
-
-        # Convert the given pixel data to a matrix of pixel data for the pygame window
-        self.led_simulator.frame[self.led_simulator.idx_map[:, 1], 
-                                 self.led_simulator.idx_map[:, 0], 
-                                 self.led_simulator.idx_map[:, 2]] = pixel_data
-
-        # Create a surface from the frame and scale it to the size of the window
-        surface = pygame.surfarray.make_surface(self.led_simulator.frame)
-        surface = pygame.transform.scale(surface, (self.led_simulator.width, self.led_simulator.height))
-
-        # Draw the surface to the screen
-        self.led_simulator.screen.blit(surface, (0, 0))
+        # Bind the simulator once; write() runs at frame cadence and the body otherwise re-walks the
+        # self.led_simulator attribute chain ten-plus times per call
+        sim = self.led_simulator
+
+        num_bytes = len(pixel_data)
+        if num_bytes == 1:
+            if bytes(pixel_data) == sim.SOF_FLAG:
+                # write() normally returns the number of bytes written, which would be one in this case.
+                return 1
+
+        # View the buffer as uint8 (send_pixels hands over a memoryview) and strip the SOF flag when the frame
+        # arrives as a single combined write
+        pixel_data = np.frombuffer(pixel_data, dtype=np.uint8)
+        if num_bytes == 1 + LEDMatrix.NUM_LEDS * 3:
+            pixel_data = pixel_data[1:]
+
+        # Coalesce writes that arrive faster than the display can show them; see __init__
+        now = time()
+        if now < self._next_render_time:
+            return num_bytes
+        self._next_render_time = now + self._min_render_interval
+
+        # Skip the whole redraw when the frame is identical to the last one drawn. An exact byte compare is a plain
+        # memcmp over ~18KB - cheaper than the scale it avoids, with none of a hash's collision risk.
+        frame_bytes = pixel_data.tobytes()
+        if frame_bytes == self._last_frame_bytes:
+            return num_bytes
+        self._last_frame_bytes = frame_bytes
+
+        # Scatter the pixel data directly into the source surface's SDL memory through the precomputed flat byte
+        # index - one index-array walk, no staging array, no blit_array copy
+        sim._frame_flat[sim._flat_scatter_idx] = pixel_data
+
+        # Scale the source surface directly onto the screen surface (3-arg in-place form): no per-frame Surface
+        # allocation and no intermediate blit. The scaled output covers the whole window (resize keeps the aspect
+        # ratio locked), so there's no need to clear the screen first.
+        # NOTE: A numba nearest-neighbour upscale kernel writing through surfarray.pixels3d was considered for the
+        # integer-factor case, but transform.scale is already SDL's C nearest-neighbour blit and the kernel would
+        # need a locked view of the display surface every frame. Resizing can also make the factor non-integer.
+        screen = sim.screen
+        pygame.transform.scale(sim._src_surf, screen.get_size(), screen)
         pygame.display.flip()
 
-        # Add an FPS counter to the window title
-        pygame.display.set_caption(self.led_simulator.window_title.format(self.led_simulator.clock.get_fps()))
+        # Add an FPS counter to the window title. set_caption goes through the window manager (a synchronous server
+        # round trip on some platforms), so only refresh it every half second
+        now = time()
+        if now - sim._last_caption_time > 0.5:
+            sim._last_caption_time = now
+            pygame.display.set_caption(sim._caption_fmt(sim.clock.get_fps()))
 
         return len(pixel_data)
 
@@ -153,16 +242,16 @@ def sim_frame(frame: Framer, scale=6, brightness=1.0, gamma=1.0, contrast=1.0):
         frame (Framer): The frame to be simulated.
     """
     # Initialize the LEDMatrix
-    led_matrix = LEDSimulator(scale=scale, brightness=brightness, gamma=gamma, contrast=contrast)
-    player = FramePlayer(led_matrix, frame)
-
-    player.play()
-    try:
-        while True:
-            player.update()
-            led_matrix.update()
-    except KeyboardInterrupt:
-        print("Exiting...")
+    with LEDSimulator(scale=scale, brightness=brightness, gamma=gamma, contrast=contrast) as led_matrix:
+        player = FramePlayer(led_matrix, frame)
+
+        player.play()
+        try:
+            while True:
+                player.update()
+                led_matrix.update()
+        except KeyboardInterrupt:
+            print("Exiting...")
 
 if __name__ == "__main__":
     # Usage example
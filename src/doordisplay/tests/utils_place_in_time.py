@@ -14,6 +14,12 @@ snowflake_mat = snowflake.matrix
 canvas = np.zeros((124, 50, 3), dtype=np.uint8)
 
 num_runs = 100000
-place_in_execution_time = timeit.timeit('place_in(canvas, snowflake_mat, 20.25, 20.25, transparent_threshold=5)', globals=globals(), number=num_runs)
+
+# Bind everything as default args so the timed statement does local loads instead of re-running a globals lookup
+# for each name every iteration; keeps the measurement about place_in itself
+def _timed_place_in(place_in=place_in, canvas=canvas, snowflake_mat=snowflake_mat):
+    place_in(canvas, snowflake_mat, 20.25, 20.25, transparent_threshold=5)
+
+place_in_execution_time = timeit.timeit(_timed_place_in, number=num_runs)
 print(f'place_in execution time: {place_in_execution_time:.3f} sec')
 print(f'place_in average time:   {place_in_execution_time / num_runs * 1000:.3f} ms')
\ No newline at end of file